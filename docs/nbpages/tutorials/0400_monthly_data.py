@@ -7,13 +7,18 @@ Note that here we are fitting a few simple models and the goal is not to optimiz
 the results as much as possible.
 """
 
+import os
+import tempfile
 import warnings
-from collections import defaultdict
 
 import plotly
 import pandas as pd
+from joblib import Parallel
+from joblib import delayed
+from joblib import parallel_backend
 
 from greykite.framework.benchmark.data_loader_ts import DataLoaderTS
+from greykite.framework.templates.autogen.forecast_config import ComputationParam
 from greykite.framework.templates.autogen.forecast_config import EvaluationPeriodParam
 from greykite.framework.templates.autogen.forecast_config import ForecastConfig
 from greykite.framework.templates.autogen.forecast_config import MetadataParam
@@ -24,14 +29,33 @@ from greykite.framework.input.univariate_time_series import UnivariateTimeSeries
 
 warnings.filterwarnings("ignore")
 
+# The plots are skipped when the environment variable ``GREYKITE_SHOW_PLOTS`` is set to "0",
+# e.g. to run this example as a batch script.
+# When ``GREYKITE_DUMP_PLOTS`` is set to "1", the plots are written to html files
+# in the temporary directory instead of being rendered.
+show_plots = os.environ.get("GREYKITE_SHOW_PLOTS", "1") == "1"
+dump_plots = os.environ.get("GREYKITE_DUMP_PLOTS", "0") == "1"
+
+
+def show_plot(fig, name):
+    """Shows ``fig``, or writes it to ``{name}.html`` if ``dump_plots`` is True."""
+    if dump_plots:
+        plotly.io.write_html(
+            fig,
+            os.path.join(tempfile.gettempdir(), f"{name}.html"),
+            include_plotlyjs="cdn",
+            auto_open=False)
+    else:
+        plotly.io.show(fig)
+
+
 # %%
 # Loads dataset into ``UnivariateTimeSeries``.
 dl = DataLoaderTS()
 agg_func = {"count": "sum"}
 df = dl.load_bikesharing(agg_freq="monthly", agg_func=agg_func)
 # In this monthly data the last month data is incomplete, therefore we drop it
-df.drop(df.tail(1).index,inplace=True)
-df.reset_index(drop=True)
+df = df.iloc[:-1].reset_index(drop=True)
 ts = UnivariateTimeSeries()
 ts.load_data(
     df=df,
@@ -55,25 +79,27 @@ print(df.head())
 # %%
 # Let's plot the original timeseries.
 # (The interactive plot is generated by ``plotly``: **click to zoom!**)
-fig = ts.plot()
-plotly.io.show(fig)
+if show_plots:
+    fig = ts.plot()
+    show_plot(fig, "monthly_ts")
 
 # %%
 # Exploratory plots can be plotted to reveal the time series's properties.
 # Monthly overlay plot can be used to inspect the annual patterns.
 # This plot overlays various years on top of each other.
-fig = ts.plot_quantiles_and_overlays(
-     groupby_time_feature="month",
-     show_mean=False,
-     show_quantiles=False,
-     show_overlays=True,
-     overlay_label_time_feature="year",
-     overlay_style={"line": {"width": 1}, "opacity": 0.5},
-     center_values=False,
-     xlabel="month of year",
-     ylabel=ts.original_value_col,
-     title="yearly seasonality for each year (centered)",)
-plotly.io.show(fig)
+if show_plots:
+    fig = ts.plot_quantiles_and_overlays(
+         groupby_time_feature="month",
+         show_mean=False,
+         show_quantiles=False,
+         show_overlays=True,
+         overlay_label_time_feature="year",
+         overlay_style={"line": {"width": 1}, "opacity": 0.5},
+         center_values=False,
+         xlabel="month of year",
+         ylabel=ts.original_value_col,
+         title="yearly seasonality for each year (centered)",)
+    show_plot(fig, "monthly_ts_quantiles")
 
 # %%
 # Specify common metadata.
@@ -107,9 +133,23 @@ evaluation_period_param = EvaluationPeriodParam(
 )
 
 # %%
-# Fit a simple model without autoregression.
+# The cross-validation splits are fitted in parallel.
+# ``n_jobs=-1`` uses all the available cores.
+computation_param = ComputationParam(n_jobs=-1)
+
+# %%
+# All models below are fitted on the same timeseries, and their features
+# (e.g. "ct_sqrt", "ct1", "month") only depend on the timestamps.
+# The time features are computed once by ``ts`` and passed to every forecast,
+# so they are reused across the models and cross-validation splits
+# instead of being recomputed for each fit.
+time_features_df = ts.get_time_features_df()
+
+# %%
+# We fit three models below. They only differ in ``extra_pred_cols`` and
+# ``autoregression``, so we first define a helper that builds their
+# ``ModelComponentsParam``.
 # The important modeling parameters for monthly data are as follows.
-# These are plugged into ``ModelComponentsParam``.
 # The ``extra_pred_cols`` is used to specify growth and annual seasonality
 # Growth is modelled with both "ct_sqrt", "ct1" for extra flexibility as we have
 # longterm data and ridge regularization will avoid over-fitting the trend.
@@ -119,42 +159,97 @@ evaluation_period_param = EvaluationPeriodParam(
 # the year, which makes categorical representation non-feasible.
 # The categorical representation of monthly also is more explainable/interpretable in the model
 # summary.
-extra_pred_cols = ["ct_sqrt", "ct1", "C(month, levels=list(range(1, 13)))"]
-autoregression = None
-
-# Specify the model parameters
-model_components = ModelComponentsParam(
-    growth=dict(growth_term=None),
-    seasonality=dict(
-        yearly_seasonality=[False],
-        quarterly_seasonality=[False],
-        monthly_seasonality=[False],
-        weekly_seasonality=[False],
-        daily_seasonality=[False]
-    ),
-    custom=dict(
-        fit_algorithm_dict=dict(fit_algorithm="ridge"),
-        extra_pred_cols=extra_pred_cols
-    ),
-    regressors=dict(regressor_cols=None),
-    autoregression=autoregression,
-    uncertainty=dict(uncertainty_dict=None),
-    events=dict(holiday_lookup_countries=None),
-)
+def get_model_components(extra_pred_cols, autoregression):
+    """Returns the ``ModelComponentsParam`` used by the models in this example."""
+    return ModelComponentsParam(
+        growth=dict(growth_term=None),
+        seasonality=dict(
+            yearly_seasonality=[False],
+            quarterly_seasonality=[False],
+            monthly_seasonality=[False],
+            weekly_seasonality=[False],
+            daily_seasonality=[False]
+        ),
+        custom=dict(
+            fit_algorithm_dict=dict(fit_algorithm="ridge"),
+            extra_pred_cols=extra_pred_cols
+        ),
+        regressors=dict(regressor_cols=None),
+        autoregression=autoregression,
+        uncertainty=dict(uncertainty_dict=None),
+        events=dict(holiday_lookup_countries=None),
+    )
 
-# Run the forecast model
-forecaster = Forecaster()
-result =  forecaster.run_forecast_config(
-    df=df,
-    config=ForecastConfig(
-        model_template="SILVERKITE",
-        coverage=0.95,
-        forecast_horizon=forecast_horizon,
-        metadata_param=meta_data_params,
-        evaluation_period_param=evaluation_period_param,
-        model_components_param=model_components
+
+# %%
+# The three models are:
+#
+#   1. A simple model without autoregression.
+#   2. A simple model with autoregression. This is done by specifying the
+#      ``autoregression`` parameter in ``ModelComponentsParam``.
+#      Note that the auto-regressive structure can be customized further depending on your data.
+#   3. A model with time-varying seasonality (month effect).
+#      This is achieved by adding ``"ct1*C(month)"`` to ``extra_pred_cols``.
+#      Note that this feature may or may not be useful in your use case.
+#      We have included this for demonstration purposes only.
+autoregression = {
+    "autoreg_dict": {
+        "lag_dict": {"orders": [1]},
+        "agg_lag_dict": None
+    }
+}
+configs = [
+    (["ct_sqrt", "ct1", "C(month, levels=list(range(1, 13)))"], None),
+    (["ct_sqrt", "ct1", "C(month, levels=list(range(1, 13)))"], autoregression),
+    (["ct_sqrt", "ct1", "C(month, levels=list(range(1, 13)))",
+      "ct1*C(month, levels=list(range(1, 13)))"], autoregression),
+]
+
+
+# %%
+# The models are independent, so we run them in parallel, one process per model.
+# ``inner_max_num_threads=1`` limits the BLAS thread pools of each worker
+# to a single thread, to avoid oversubscribing the cores
+# when the cross-validation splits are also fitted in parallel.
+def run_model(df, extra_pred_cols, autoregression):
+    """Runs the forecast for one model in ``configs``."""
+    return Forecaster().run_forecast_config(
+        df=df,
+        config=ForecastConfig(
+            model_template="SILVERKITE",
+            coverage=0.95,
+            forecast_horizon=forecast_horizon,
+            metadata_param=meta_data_params,
+            evaluation_period_param=evaluation_period_param,
+            model_components_param=get_model_components(
+                extra_pred_cols=extra_pred_cols,
+                autoregression=autoregression),
+            computation_param=computation_param
+        ),
+        time_features_df=time_features_df
     )
-)
+
+
+with parallel_backend("loky", inner_max_num_threads=1):
+    results = Parallel(n_jobs=-1)(
+        delayed(run_model)(df, extra_pred_cols, autoregression)
+        for extra_pred_cols, autoregression in configs)
+
+
+def get_backtest_metrics(backtest):
+    """Returns the train and test evaluation metrics of ``backtest`` side by side."""
+    metric_names = list(backtest.train_evaluation)
+    return pd.DataFrame(
+        {
+            "train": [backtest.train_evaluation[metric] for metric in metric_names],
+            "test": [backtest.test_evaluation[metric] for metric in metric_names]
+        },
+        index=metric_names)
+
+
+# %%
+# Results of the simple model without autoregression.
+result = results[0]
 
 # Get the useful fields from the forecast result
 model = result.model[-1]
@@ -178,73 +273,29 @@ cv_results = summarize_grid_search_results(
 print(cv_results.transpose())
 
 # Check historical evaluation metrics (on the historical training/test set).
-backtest_eval = defaultdict(list)
-for metric, value in backtest.train_evaluation.items():
-    backtest_eval[metric].append(value)
-    backtest_eval[metric].append(backtest.test_evaluation[metric])
-metrics = pd.DataFrame(backtest_eval, index=["train", "test"]).T
-print(metrics)
+print(get_backtest_metrics(backtest))
 
 # %%
 # Fit/backtest plot:
-fig = backtest.plot()
-plotly.io.show(fig)
+if show_plots:
+    fig = backtest.plot()
+    show_plot(fig, "monthly_model0_backtest")
 
 # %%
 # Forecast plot:
-fig = forecast.plot()
-plotly.io.show(fig)
+if show_plots:
+    fig = forecast.plot()
+    show_plot(fig, "monthly_model0_forecast")
 
 # %%
 # The components plot:
-fig = forecast.plot_components()
-plotly.io.show(fig)
+if show_plots:
+    fig = forecast.plot_components()
+    show_plot(fig, "monthly_model0_forecast_components")
 
 # %%
-# Fit a simple model with autoregression.
-# This is done by specifying the ``autoregression`` parameter in ``ModelComponentsParam``.
-# Note that the auto-regressive structure can be customized further depending on your data.
-extra_pred_cols = ["ct_sqrt", "ct1", "C(month, levels=list(range(1, 13)))"]
-autoregression = {
-    "autoreg_dict": {
-        "lag_dict": {"orders": [1]},
-        "agg_lag_dict": None
-    }
-}
-
-# Specify the model parameters
-model_components = ModelComponentsParam(
-    growth=dict(growth_term=None),
-    seasonality=dict(
-        yearly_seasonality=[False],
-        quarterly_seasonality=[False],
-        monthly_seasonality=[False],
-        weekly_seasonality=[False],
-        daily_seasonality=[False]
-    ),
-    custom=dict(
-        fit_algorithm_dict=dict(fit_algorithm="ridge"),
-        extra_pred_cols=extra_pred_cols
-    ),
-    regressors=dict(regressor_cols=None),
-    autoregression=autoregression,
-    uncertainty=dict(uncertainty_dict=None),
-    events=dict(holiday_lookup_countries=None),
-)
-
-# Run the forecast model
-forecaster = Forecaster()
-result =  forecaster.run_forecast_config(
-    df=df,
-    config=ForecastConfig(
-        model_template="SILVERKITE",
-        coverage=0.95,
-        forecast_horizon=forecast_horizon,
-        metadata_param=meta_data_params,
-        evaluation_period_param=evaluation_period_param,
-        model_components_param=model_components
-    )
-)
+# Results of the simple model with autoregression.
+result = results[1]
 
 # Get the useful fields from the forecast result
 model = result.model[-1]
@@ -268,76 +319,30 @@ cv_results = summarize_grid_search_results(
 print(cv_results.transpose())
 
 # Check historical evaluation metrics (on the historical training/test set).
-backtest_eval = defaultdict(list)
-for metric, value in backtest.train_evaluation.items():
-    backtest_eval[metric].append(value)
-    backtest_eval[metric].append(backtest.test_evaluation[metric])
-metrics = pd.DataFrame(backtest_eval, index=["train", "test"]).T
-print(metrics)
+print(get_backtest_metrics(backtest))
 
 # %%
 # Fit/backtest plot:
-fig = backtest.plot()
-plotly.io.show(fig)
+if show_plots:
+    fig = backtest.plot()
+    show_plot(fig, "monthly_model1_backtest")
 
 # %%
 # Forecast plot:
-fig = forecast.plot()
-plotly.io.show(fig)
+if show_plots:
+    fig = forecast.plot()
+    show_plot(fig, "monthly_model1_forecast")
 
 # %%
 # The components plot:
-fig = forecast.plot_components()
-plotly.io.show(fig)
+if show_plots:
+    fig = forecast.plot_components()
+    show_plot(fig, "monthly_model1_forecast_components")
 
 # %%
-# Fit a model with time-varying seasonality (month effect).
-# This is achieved by adding ``"ct1*C(month)"`` to ``ModelComponentsParam``.
-# Note that this feature may or may not be useful in your use case.
-# We have included this for demonstration purposes only.
+# Results of the model with time-varying seasonality (month effect).
 # In this example, while the fit has improved the backtest is inferior to the previous setting.
-extra_pred_cols = ["ct_sqrt", "ct1", "C(month, levels=list(range(1, 13)))",
-                   "ct1*C(month, levels=list(range(1, 13)))"]
-autoregression = {
-    "autoreg_dict": {
-        "lag_dict": {"orders": [1]},
-        "agg_lag_dict": None
-    }
-}
-
-# Specify the model parameters
-model_components = ModelComponentsParam(
-    growth=dict(growth_term=None),
-    seasonality=dict(
-        yearly_seasonality=[False],
-        quarterly_seasonality=[False],
-        monthly_seasonality=[False],
-        weekly_seasonality=[False],
-        daily_seasonality=[False]
-    ),
-    custom=dict(
-        fit_algorithm_dict=dict(fit_algorithm="ridge"),
-        extra_pred_cols=extra_pred_cols
-    ),
-    regressors=dict(regressor_cols=None),
-    autoregression=autoregression,
-    uncertainty=dict(uncertainty_dict=None),
-    events=dict(holiday_lookup_countries=None),
-)
-
-# Run the forecast model
-forecaster = Forecaster()
-result =  forecaster.run_forecast_config(
-    df=df,
-    config=ForecastConfig(
-        model_template="SILVERKITE",
-        coverage=0.95,
-        forecast_horizon=forecast_horizon,
-        metadata_param=meta_data_params,
-        evaluation_period_param=evaluation_period_param,
-        model_components_param=model_components
-    )
-)
+result = results[2]
 
 # Get the useful fields from the forecast result
 model = result.model[-1]
@@ -361,25 +366,22 @@ cv_results = summarize_grid_search_results(
 print(cv_results.transpose())
 
 # Check historical evaluation metrics (on the historical training/test set).
-backtest_eval = defaultdict(list)
-for metric, value in backtest.train_evaluation.items():
-    backtest_eval[metric].append(value)
-    backtest_eval[metric].append(backtest.test_evaluation[metric])
-metrics = pd.DataFrame(backtest_eval, index=["train", "test"]).T
-print(metrics)
+print(get_backtest_metrics(backtest))
 
 # %%
 # Fit/backtest plot:
-fig = backtest.plot()
-plotly.io.show(fig)
+if show_plots:
+    fig = backtest.plot()
+    show_plot(fig, "monthly_model2_backtest")
 
 # %%
 # Forecast plot:
-fig = forecast.plot()
-plotly.io.show(fig)
+if show_plots:
+    fig = forecast.plot()
+    show_plot(fig, "monthly_model2_forecast")
 
 # %%
 # The components plot:
-fig = forecast.plot_components()
-plotly.io.show(fig)
-
+if show_plots:
+    fig = forecast.plot_components()
+    show_plot(fig, "monthly_model2_forecast_components")
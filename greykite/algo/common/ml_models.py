@@ -26,6 +26,7 @@ and use it for prediction.
 import random
 import re
 import warnings
+from functools import lru_cache
 
 import matplotlib
 import numpy as np
@@ -59,6 +60,23 @@ import matplotlib.pyplot as plt  # isort:skip
 register_matplotlib_converters()
 
 
+@lru_cache(maxsize=64)
+def _model_desc_from_formula(model_formula_str):
+    """Parses ``model_formula_str`` into a `patsy.ModelDesc`.
+
+    The parsed description only depends on the formula string,
+    so it is cached and reused when the same formula is fit
+    repeatedly, e.g. across cross-validation splits.
+    The `patsy.DesignInfo` depends on the data and is not cached.
+
+    :param model_formula_str: str
+        A formula string e.g. "y~x1+x2+x3*x4".
+    :return: patsy.ModelDesc
+        The parsed model description.
+    """
+    return patsy.ModelDesc.from_formula(model_formula_str)
+
+
 def design_mat_from_formula(
         df,
         model_formula_str,
@@ -90,7 +108,7 @@ def design_mat_from_formula(
     """
     if model_formula_str is not None:
         y, x_mat = patsy.dmatrices(
-            model_formula_str,
+            _model_desc_from_formula(model_formula_str),
             data=df,
             return_type="dataframe")
         pred_cols = list(x_mat.columns)
@@ -153,6 +171,11 @@ def fit_model_via_design_matrix(
 
         "linear" is the same as "statsmodels_ols", because `statsmodels.regression.linear_model.OLS`
         is more stable than `sklearn.linear_model.LinearRegression`.
+
+        For "ridge", when the design matrix has more columns than rows
+        (e.g. interactions with categorical terms on short monthly series),
+        `sklearn.linear_model.Ridge` solves the dual (kernel) form of the problem,
+        which only requires factorizing an ``n x n`` matrix instead of ``p x p``.
     sample_weight : `numpy.array` or None, default None
         The vector of weights to be used in weighted models.
         These weights will be used to weigh each loss potentially differently.
@@ -243,6 +266,13 @@ def fit_model_via_design_matrix(
         ml_model.intercept_ = 0.
     else:
         ml_model = fit_algorithm_dict[fit_algorithm](**params)
+        # The cross-validated models (e.g. ``RidgeCV``) are refitted for every fold and candidate
+        # parameter. On small datasets, indexing and validating a `pandas.DataFrame` in each fit
+        # dominates the runtime, so the models are fitted on contiguous arrays instead.
+        x_train = np.ascontiguousarray(x_train, dtype=np.float64)
+        y_train = np.asarray(y_train, dtype=np.float64)
+        if sample_weight is not None:
+            sample_weight = np.asarray(sample_weight, dtype=np.float64)
         if fit_algorithm == "ridge":
             ml_model.fit(
                 X=x_train,
@@ -395,7 +425,7 @@ def fit_ml_model(
                     cols = list(x_mat.columns)
                 new_x_mat[cols] = normalize_df_func(new_x_mat[cols])
             new_x_mat = new_x_mat.fillna(value=0)
-            new_df[f"{y_col}_pred"] = ml_model.predict(new_x_mat)
+            new_df[f"{y_col}_pred"] = ml_model.predict(new_x_mat.to_numpy())
             new_df["fit_residual"] = new_df[y_col] - new_df[f"{y_col}_pred"]
 
             # re-assign some param defaults for function conf_interval
@@ -496,7 +526,8 @@ def predict_ml(
             cols = list(x_mat.columns)
         x_mat[cols] = trained_model["normalize_df_func"](x_mat[cols])
     x_mat = x_mat.fillna(value=0)
-    y_pred = ml_model.predict(x_mat)
+    # The models are fitted on arrays, see ``fit_model_via_design_matrix``.
+    y_pred = ml_model.predict(x_mat.to_numpy())
     if min_admissible_value is not None or max_admissible_value is not None:
         y_pred = np.clip(
             a=y_pred,
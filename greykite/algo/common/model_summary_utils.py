@@ -373,8 +373,6 @@ def add_model_df_lm(info_dict):
     x = info_dict["x"]
     n_sample = info_dict["n_sample"]
     w = info_dict.get("weights")
-    if w is None:
-        w = np.eye(n_sample)
     alpha = info_dict.get("alpha", 0)
     l1_ratio = info_dict.get("l1_ratio", 0)
     # In ElasticNet type models (ElasticNetCV, SGD with penalty == "elasticnet"), the penalty is
@@ -386,7 +384,12 @@ def add_model_df_lm(info_dict):
         alpha = 0  # alpha is specifically for l2 norm regularization in calculating df
     nonzero_idx = info_dict["nonzero_index"]
     x_nz = x[:, nonzero_idx]
-    xtwx = x_nz.T @ w @ x_nz
+    # For non-weighted methods, W is the identity matrix.
+    # The n x n identity matrix is not materialized, which causes memory overflow for large n.
+    if w is None:
+        xtwx = x_nz.T @ x_nz
+    else:
+        xtwx = x_nz.T @ w @ x_nz
     xtwx_alphai = xtwx + alpha * np.eye(x_nz.shape[1])
     xtwx_alphai_inv = np.linalg.pinv(xtwx_alphai)
     # The hat matrix was x_nz @ xtwx_alphai_inv @ x_nz.T @ w.
@@ -395,7 +398,7 @@ def add_model_df_lm(info_dict):
     # Using the trace property trace(ABCD)=trace(CDAB),
     # we compute x_nz.T @ w @ x_nz @ xtwx_alphai_inv,
     # which has dimension p x p.
-    trace = np.trace(x_nz.T @ w @ x_nz @ xtwx_alphai_inv)
+    trace = np.trace(xtwx @ xtwx_alphai_inv)
     info_dict["x_nz"] = x_nz
     info_dict["condition_number"] = np.linalg.cond(xtwx_alphai)
     info_dict["xtwx_alphai_inv"] = xtwx_alphai_inv  # (X'WX+aI)^-1
@@ -448,16 +451,20 @@ def add_model_ss_lm(info_dict):
     """
     residual = info_dict["residual"]
     weights = info_dict.get("weights")
-    if weights is None:
-        weights = np.eye(info_dict["n_sample"])
     y = info_dict["y"]
     y_pred = info_dict["y_pred"]
     y_mean = info_dict["y_mean"]
-    info_dict["sse"] = residual.T @ weights @ residual
+    if weights is None:
+        # Non-weighted methods, avoids materializing the n x n identity matrix.
+        info_dict["sse"] = residual.T @ residual
+        info_dict["ssr"] = (y_pred - y_mean).T @ (y_pred - y_mean)
+        info_dict["sst"] = (y - y_mean).T @ (y - y_mean)
+    else:
+        info_dict["sse"] = residual.T @ weights @ residual
+        info_dict["ssr"] = (y_pred - y_mean).T @ weights @ (y_pred - y_mean)
+        info_dict["sst"] = (y - y_mean).T @ weights @ (y - y_mean)
     info_dict["mse"] = info_dict["sse"] / info_dict["df_sse"]
-    info_dict["ssr"] = (y_pred - y_mean).T @ weights @ (y_pred - y_mean)
     info_dict["msr"] = info_dict["ssr"] / info_dict["df_ssr"]
-    info_dict["sst"] = (y - y_mean).T @ weights @ (y - y_mean)
     info_dict["mst"] = info_dict["sst"] / info_dict["df_sst"]
     return info_dict
 
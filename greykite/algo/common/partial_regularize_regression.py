@@ -272,7 +272,9 @@ class PartialRegularizeRegression:
         d[:x0.shape[1], :x0.shape[1]] = np.zeros([x0.shape[1], x0.shape[1]])  # Non-penalized part is all zero.
         # This is the matrix to be multiplied to the response vector to produce the estimated beta
         # for the non-penalized and L2 norm penalized part.
-        hl02_r = np.linalg.pinv(x02.T @ x02 + l2_alpha * d) @ x02.T
+        # ``x02.T @ x02 + l2_alpha * d`` is symmetric positive semi-definite,
+        # ``hermitian=True`` computes the pseudo-inverse with an eigendecomposition instead of SVD.
+        hl02_r = np.linalg.pinv(x02.T @ x02 + l2_alpha * d, hermitian=True) @ x02.T
         hl02 = x02 @ hl02_r
         i02 = np.eye(x.shape[0])
         return {
@@ -578,7 +580,9 @@ class PartialRegularizeRegressionCV:
         x02 = np.concatenate([x0, x2], axis=1)
         d = np.eye(x02.shape[1])
         d[:x0.shape[1], :x0.shape[1]] = np.zeros([x0.shape[1], x0.shape[1]])
-        hl02_r = np.linalg.pinv(x02.T @ x02 + l2_alpha * d) @ x02.T
+        # ``x02.T @ x02 + l2_alpha * d`` is symmetric positive semi-definite,
+        # ``hermitian=True`` computes the pseudo-inverse with an eigendecomposition instead of SVD.
+        hl02_r = np.linalg.pinv(x02.T @ x02 + l2_alpha * d, hermitian=True) @ x02.T
         hl02 = x02 @ hl02_r
         i02 = np.eye(x.shape[0])
         return {
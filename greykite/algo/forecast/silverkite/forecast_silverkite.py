@@ -115,7 +115,8 @@ class SilverkiteForecast():
             regression_weight_col=None,
             forecast_horizon=None,
             simulation_based=False,
-            simulation_num=10):
+            simulation_num=10,
+            time_features_df=None):
         """A function for forecasting.
         It captures growth, seasonality, holidays and other patterns.
         See "Capturing the time-dependence in the precipitation process for
@@ -482,6 +483,15 @@ class SilverkiteForecast():
         simulation_num : `int`, default 10
             The number of simulations for when simulations are used for generating
             forecasts and prediction intervals.
+        time_features_df : `pandas.DataFrame` or None, default None
+            Precomputed time features for the timestamps in ``df``, the output of
+            `~greykite.common.features.timeseries_features.build_time_features_df`.
+            Useful when fitting several models on the same timeseries, for example
+            in cross-validation. The features are looked up by timestamp instead of
+            recomputed; growth terms are recomputed from ``origin_for_time_vars``.
+            It is only used to fit the model and is not stored in the trained model,
+            the features are built at predict time.
+            If None or if it does not cover the timestamps, the features are built from scratch.
 
         Returns
         -------
@@ -793,7 +803,8 @@ class SilverkiteForecast():
             growth_func=growth_func,
             fs_func=fs_func,
             seasonality_changepoint_result=seasonality_changepoint_result,
-            changepoint_dates=trend_changepoint_dates)
+            changepoint_dates=trend_changepoint_dates,
+            time_features_df=time_features_df)
 
         # Adds autoregression columns to feature matrix
         autoreg_func = None
@@ -2423,7 +2434,8 @@ class SilverkiteForecast():
             growth_func=None,
             fs_func=None,
             seasonality_changepoint_result=None,
-            changepoint_dates=None):
+            changepoint_dates=None,
+            time_features_df=None):
         """This function adds the prediction model features in training and
         predict phase for ``self.forecast`` internal use but can be called
         outside that context if desired.
@@ -2537,6 +2549,12 @@ class SilverkiteForecast():
             `~greykite.algo.changepoint.adalasso.changepoint_detector.ChangepointDetector.find_seasonality_changepoints`.
         changepoint_dates : `list`
             List of change point dates with `strftime` attribute.
+        time_features_df : `pandas.DataFrame` or None, default None
+            Precomputed time features, the output of
+            `~greykite.common.features.timeseries_features.build_time_features_df`.
+            If provided and it covers all timestamps in ``df``, the time features
+            are looked up instead of recomputed.
+            See `~greykite.common.features.timeseries_features.add_time_features_df`.
 
         Returns
         -------
@@ -2547,7 +2565,8 @@ class SilverkiteForecast():
         features_df = add_time_features_df(
             df=df,
             time_col=time_col,
-            conti_year_origin=origin_for_time_vars)
+            conti_year_origin=origin_for_time_vars,
+            time_features_df=time_features_df)
 
         # adds daily events (e.g. holidays)
         # if daily event data are given, we add them to temporal features data
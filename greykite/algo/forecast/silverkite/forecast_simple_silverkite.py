@@ -108,7 +108,8 @@ class SimpleSilverkiteForecast(SilverkiteForecast):
             explicit_pred_cols: Optional[List[str]] = None,
             regression_weight_col: Optional[str] = None,
             simulation_based: Optional[bool] = False,
-            simulation_num: int = 10):
+            simulation_num: int = 10,
+            time_features_df: Optional[pd.DataFrame] = None):
         """Converts parameters of
         :func:`~greykite.algo.forecast.silverkite.forecast_simple_silverkite` into those
         of :func:`~greykite.algo.forecast.forecast_silverkite.SilverkiteForecast::forecast`.
@@ -552,6 +553,9 @@ class SimpleSilverkiteForecast(SilverkiteForecast):
         simulation_num : `int`, default 10
             The number of simulations for when simulations are used for generating
             forecasts and prediction intervals.
+        time_features_df : `pandas.DataFrame` or None, default None
+            Precomputed time features to reuse instead of recomputing them.
+            See :func:`~greykite.algo.forecast.silverkite.SilverkiteForecast.forecast`.
 
 
         Returns
@@ -713,7 +717,8 @@ class SimpleSilverkiteForecast(SilverkiteForecast):
             regression_weight_col=regression_weight_col,                    # pass-through
             forecast_horizon=forecast_horizon,                              # pass-through
             simulation_based=simulation_based,                              # pass-through
-            simulation_num=simulation_num                                   # pass-through
+            simulation_num=simulation_num,                                  # pass-through
+            time_features_df=time_features_df                               # pass-through
         )
 
         return parameters
@@ -258,17 +258,47 @@ def build_time_features_df(dt, conti_year_origin):
     return df
 
 
-def add_time_features_df(df, time_col, conti_year_origin):
+def add_time_features_df(df, time_col, conti_year_origin, time_features_df=None):
     """Adds a time feature data frame to a data frame
     :param df: the input data frame
     :param time_col: the name of the time column of interest
     :param conti_year_origin: the origin of time for the continuous time variable
+    :param time_features_df: Optional[pd.DataFrame]
+        Precomputed output of `build_time_features_df`, e.g. on the full
+        timeseries, which is reused to avoid recomputing the features when
+        the same timestamps are processed repeatedly (cross-validation splits,
+        several models fitted on the same data).
+        Rows are looked up by the "datetime" column and the growth terms are
+        recomputed from "conti_year" with ``conti_year_origin``, so the cache
+        can be built with any origin. If any timestamp in ``df`` is not found,
+        the features are built from scratch.
+        Pass it indexed by "datetime" (e.g. from
+        `~greykite.framework.input.univariate_time_series.UnivariateTimeSeries.get_time_features_df`)
+        to avoid re-indexing it on every call.
     :return: the same data frame (df) augmented with new columns
     """
     df = df.reset_index(drop=True)
-    time_df = build_time_features_df(
-        dt=df[time_col],
-        conti_year_origin=conti_year_origin)
+    time_df = None
+    if time_features_df is not None:
+        dt = pd.DatetimeIndex(df[time_col])
+        cached_df = time_features_df
+        if not isinstance(cached_df.index, pd.DatetimeIndex):
+            cached_df = cached_df.set_index("datetime", drop=False)
+        # ``is_unique`` is cached on the index, so this is cheap for a pre-indexed cache.
+        indexer = cached_df.index.get_indexer(dt) if cached_df.index.is_unique else None
+        if indexer is not None and (indexer >= 0).all():
+            time_df = cached_df.iloc[indexer].copy()
+            # growth terms depend on the origin
+            ct1 = time_df["conti_year"] - conti_year_origin
+            time_df["ct1"] = ct1
+            time_df["ct2"] = signed_pow(ct1, 2)
+            time_df["ct3"] = signed_pow(ct1, 3)
+            time_df["ct_sqrt"] = signed_pow(ct1, 1/2)
+            time_df["ct_root3"] = signed_pow(ct1, 1/3)
+    if time_df is None:
+        time_df = build_time_features_df(
+            dt=df[time_col],
+            conti_year_origin=conti_year_origin)
     time_df = time_df.reset_index(drop=True)
     return pd.concat([df, time_df], axis=1)
 
@@ -34,6 +34,8 @@ import pandas as pd
 
 from greykite.common.constants import TIME_COL
 from greykite.common.constants import VALUE_COL
+from greykite.common.features.timeseries_features import build_time_features_df
+from greykite.common.features.timeseries_features import get_default_origin_for_time_vars
 from greykite.common.logging import LoggingLevelEnum
 from greykite.common.logging import log_message
 from greykite.common.time_properties import describe_timeseries
@@ -106,6 +108,9 @@ class UnivariateTimeSeries:
     df_before_adjustment : `pandas.DataFrame` or None, default None
         ``self.df`` before adjustment by ``anomaly_info``.
         Used by ``self.plot()`` to show the adjustment.
+    time_features_df : `pandas.DataFrame` or None, default None
+        Time features of ``self.df``, computed by ``self.get_time_features_df()``.
+        None until that method is called.
     """
     def __init__(self) -> None:
         self.df: Optional[pd.DataFrame] = None
@@ -126,6 +131,7 @@ class UnivariateTimeSeries:
         self.freq: Optional[str] = None
         self.anomaly_info: Optional[Union[Dict, List[Dict]]] = None
         self.df_before_adjustment: Optional[pd.DataFrame] = None
+        self.time_features_df: Optional[pd.DataFrame] = None
 
     def load_data(
             self,
@@ -243,6 +249,8 @@ class UnivariateTimeSeries:
         self.last_date_for_val = canonical_data_dict["last_date_for_val"]
         self.last_date_for_reg = canonical_data_dict["last_date_for_reg"]
         self.last_date_for_lag_reg = canonical_data_dict["last_date_for_lag_reg"]
+        # time features are computed from the new ``self.df`` on request
+        self.time_features_df = None
 
         # y (possibly with null values) after gaps have been filled in and anomalies corrected
         self.y = self.df[VALUE_COL]
@@ -316,6 +324,32 @@ class UnivariateTimeSeries:
         log_message(repr(self.value_stats), LoggingLevelEnum.INFO)
         return self.value_stats
 
+    def get_time_features_df(self):
+        """Returns the time features of the loaded timeseries.
+
+        The features are computed once by
+        `~greykite.common.features.timeseries_features.build_time_features_df`
+        and cached in ``self.time_features_df``, indexed by the "datetime" column
+        so that lookups do not re-index it.
+        As they only depend on the timestamps, they can be passed to
+        `~greykite.framework.templates.forecaster.Forecaster.run_forecast_config`
+        to be reused across model fits and cross-validation splits.
+
+        Returns
+        -------
+        time_features_df : `pandas.DataFrame`
+            Time features for each timestamp in ``self.df``.
+            See `~greykite.common.features.timeseries_features.build_time_features_df`.
+        """
+        if self.df is None:
+            raise RuntimeError("Must load data before computing time features.")
+        if self.time_features_df is None:
+            self.time_features_df = build_time_features_df(
+                dt=self.df[TIME_COL],
+                conti_year_origin=get_default_origin_for_time_vars(self.df, TIME_COL)
+            ).set_index("datetime", drop=False)
+        return self.time_features_df
+
     def make_future_dataframe(self, periods: int = None, include_history=True):
         """Extends the input data for prediction into the future.
 
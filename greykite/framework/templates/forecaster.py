@@ -296,10 +296,24 @@ class Forecaster:
         self.__apply_forecast_one_by_one_to_pipeline_parameters()
         return self.pipeline_params
 
+    def __apply_time_features_df_to_pipeline_parameters(self, time_features_df: pd.DataFrame):
+        """Sets the precomputed ``time_features_df`` on the pipeline estimator,
+        if the estimator accepts it (Silverkite estimators).
+        The parameter is set on the pipeline instead of ``hyperparameter_grid``,
+        so it is not reported in the grid search results.
+        """
+        pipeline = self.pipeline_params["pipeline"]
+        if "estimator__time_features_df" in pipeline.get_params():
+            pipeline.set_params(estimator__time_features_df=time_features_df)
+        else:
+            log_message(f"The estimator {pipeline.steps[-1][1].__class__.__name__} does not "
+                        f"accept `time_features_df`, it is ignored.", LoggingLevelEnum.WARNING)
+
     def run_forecast_config(
             self,
             df: pd.DataFrame,
-            config: Optional[ForecastConfig] = None) -> ForecastResult:
+            config: Optional[ForecastConfig] = None,
+            time_features_df: Optional[pd.DataFrame] = None) -> ForecastResult:
         """Creates a forecast from input data and config.
         The result is also stored as ``self.forecast_result``.
 
@@ -312,6 +326,14 @@ class Forecaster:
         config : :class:`~greykite.framework.templates.model_templates.ForecastConfig`
             Config object for template class to use.
             See :class:`~greykite.framework.templates.model_templates.ForecastConfig`.
+        time_features_df : `pandas.DataFrame` or None, default None
+            Precomputed time features for the timestamps in ``df``, the output of
+            `~greykite.common.features.timeseries_features.build_time_features_df`.
+            If provided, Silverkite estimators look up the time features instead of
+            recomputing them for every cross-validation split and model fit.
+            This is useful when running several configs on the same ``df``,
+            because the features can be computed once and passed to each call.
+            Ignored with a warning by estimators that do not support it.
 
         Returns
         -------
@@ -325,6 +347,8 @@ class Forecaster:
         pipeline_parameters = self.apply_forecast_config(
             df=df,
             config=config)
+        if time_features_df is not None:
+            self.__apply_time_features_df_to_pipeline_parameters(time_features_df)
         self.forecast_result = forecast_pipeline(**pipeline_parameters)
         return self.forecast_result
 
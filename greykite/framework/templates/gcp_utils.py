@@ -29,6 +29,8 @@ from collections import OrderedDict
 import dill
 from patsy.design_info import DesignInfo
 from google.cloud import storage 
+
+from greykite.framework.templates.pickle_utils import get_obj_attributes
     
 
 def upload_local_directory_to_gcs(local_path, bucket_name, gcs_path):
@@ -397,7 +399,7 @@ def dump_obj_cloud(
             dill.dump(
                 obj.__class__,
                 open(os.path.join(dir_name, f"{obj_name}.type"), "wb"))  # type is class itself
-            for key, value in obj.__dict__.items():
+            for key, value in get_obj_attributes(obj).items():
                 dump_obj(
                     value,
                     os.path.join(dir_name, obj_name),
@@ -57,6 +57,39 @@ def recursive_rm_dir(dir_name):
         os.remove(dir_name)
 
 
+def get_obj_attributes(obj):
+    """Returns the attributes of a class instance.
+
+    Includes the attributes in ``obj.__dict__`` and the attributes stored
+    in ``__slots__`` of every class in the method resolution order.
+    Slots that are not set are skipped.
+
+    Parameters
+    ----------
+    obj : `object`
+        The class instance.
+
+    Returns
+    -------
+    attributes : `dict` [`str`, any]
+        The attribute names and values.
+    """
+    attributes = {}
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for slot in slots:
+            if slot in ("__dict__", "__weakref__"):
+                continue
+            try:
+                attributes[slot] = getattr(obj, slot)
+            except AttributeError:
+                pass
+    attributes.update(getattr(obj, "__dict__", {}))
+    return attributes
+
+
 def dump_obj(
         obj,
         dir_name,
@@ -251,7 +284,7 @@ def dump_obj(
             dill.dump(
                 obj.__class__,
                 open(os.path.join(dir_name, f"{obj_name}.type"), "wb"))  # type is class itself
-            for key, value in obj.__dict__.items():
+            for key, value in get_obj_attributes(obj).items():
                 dump_obj(
                     value,
                     os.path.join(dir_name, obj_name),
@@ -133,7 +133,8 @@ class SilverkiteEstimator(BaseSilverkiteEstimator):
             regression_weight_col=None,
             forecast_horizon=None,
             simulation_based=False,
-            simulation_num=10):
+            simulation_num=10,
+            time_features_df=None):
         # every subclass of BaseSilverkiteEstimator must call super().__init__
         super().__init__(
             silverkite=silverkite,
@@ -173,6 +174,7 @@ class SilverkiteEstimator(BaseSilverkiteEstimator):
         self.forecast_horizon = forecast_horizon
         self.simulation_based = simulation_based
         self.simulation_num = simulation_num
+        self.time_features_df = time_features_df
         self.validate_inputs()
 
     def validate_inputs(self):
@@ -255,7 +257,8 @@ class SilverkiteEstimator(BaseSilverkiteEstimator):
             regression_weight_col=self.regression_weight_col,
             forecast_horizon=self.forecast_horizon,
             simulation_based=self.simulation_based,
-            simulation_num=self.simulation_num)
+            simulation_num=self.simulation_num,
+            time_features_df=self.time_features_df)
         # sets attributes based on ``self.model_dict``
         super().finish_fit()
 
@@ -141,7 +141,8 @@ class SimpleSilverkiteEstimator(BaseSilverkiteEstimator):
             explicit_pred_cols: Optional[List[str]] = None,
             regression_weight_col: Optional[str] = None,
             simulation_based: Optional[bool] = False,
-            simulation_num: int = 10):
+            simulation_num: int = 10,
+            time_features_df: Optional[pd.DataFrame] = None):
         # every subclass of BaseSilverkiteEstimator must call super().__init__
         super().__init__(
             silverkite=silverkite,
@@ -194,6 +195,7 @@ class SimpleSilverkiteEstimator(BaseSilverkiteEstimator):
         self.regression_weight_col = regression_weight_col
         self.simulation_based = simulation_based
         self.simulation_num = simulation_num
+        self.time_features_df = time_features_df
         # ``forecast_simple_silverkite`` generates a ``fs_components_df`` to call
         # ``forecast_silverkite`` that is compatible with ``BaseSilverkiteEstimator``.
         # Unlike ``SilverkiteEstimator``, this does not need to call ``validate_inputs``.
@@ -289,7 +291,8 @@ class SimpleSilverkiteEstimator(BaseSilverkiteEstimator):
             explicit_pred_cols=self.explicit_pred_cols,
             regression_weight_col=self.regression_weight_col,
             simulation_based=self.simulation_based,
-            simulation_num=self.simulation_num)
+            simulation_num=self.simulation_num,
+            time_features_df=self.time_features_df)
 
         # Sets attributes based on ``self.model_dict``
         super().finish_fit()
@@ -25,8 +25,12 @@ from abc import abstractmethod
 from typing import Dict
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
+from greykite.common import constants as cst
+from greykite.sklearn.uncertainty.exceptions import UncertaintyError
+
 
 class BaseUncertaintyModel:
     """The base uncertainty model.
@@ -40,6 +44,10 @@ class BaseUncertaintyModel:
                     `~greykite.sklearn.uncertainty.uncertainty_methods.UncertaintyMethodEnum`.
                 "params": a dictionary that includes any additional parameters needed by the uncertainty method.
 
+    value_col : `str` or None
+        The column name for values in ``train_df`` and ``fut_df``.
+        In ``self.predict``, the intervals are built around this column
+        if `~greykite.common.constants.PREDICTED_COL` is not in ``fut_df``.
     uncertainty_method : `str` or None
         The name of the uncertainty model.
         Must be in `~greykite.sklearn.uncertainty.uncertainty_methods.UncertaintyMethodEnum`.
@@ -47,16 +55,37 @@ class BaseUncertaintyModel:
         The parameters to be fed into the uncertainty model.
     train_df : `pandas.DataFrame` or None
         The data used to fit the uncertainty model.
+    _train_arrays : `dict` [`str`, `numpy.ndarray`] or None
+        The cache of ``self._get_train_array``.
+    _train_arrays_df : `pandas.DataFrame` or None
+        The ``train_df`` that ``_train_arrays`` was built from.
     uncertainty_model : any or None
         The uncertainty model.
     pred_df : `pandas.DataFrame`
         The prediction result df.
     """
+    # The known attributes are stored in slots.
+    # Additional ``kwargs`` passed to ``__init__`` fall back to ``__dict__``,
+    # which is only created when such attributes are set.
+    __slots__ = (
+        "uncertainty_dict",
+        "value_col",
+        "uncertainty_method",
+        "params",
+        "train_df",
+        "_train_arrays",
+        "_train_arrays_df",
+        "uncertainty_model",
+        "pred_df",
+        "__dict__"
+    )
+
     def __init__(
             self,
             uncertainty_dict: Dict[str, any],
             **kwargs):
         self.uncertainty_dict = uncertainty_dict
+        self.value_col: Optional[str] = None
         for key, value in kwargs.items():
             setattr(self, key, value)
 
@@ -64,6 +93,8 @@ class BaseUncertaintyModel:
         self.uncertainty_method: Optional[str] = None
         self.params: Optional[dict] = None
         self.train_df: Optional[pd.DataFrame] = None
+        self._train_arrays: Optional[Dict[str, np.ndarray]] = None
+        self._train_arrays_df: Optional[pd.DataFrame] = None
         self.uncertainty_model: Optional[any] = None
 
         # Set by ``predict`` method.
@@ -91,16 +122,100 @@ class BaseUncertaintyModel:
         train_df : `pandas.DataFrame`
             The training data.
         """
-        self.train_df = train_df
+        # A shallow copy, so that new columns added to the input
+        # do not change ``self.train_df``. The data are not copied.
+        self.train_df = train_df.copy(deep=False)
+
+    def _get_train_array(
+            self,
+            col: str) -> np.ndarray:
+        """Returns a column of ``self.train_df`` as a contiguous array.
+
+        Subclasses should read columns with this method in hot loops
+        instead of ``self.train_df[col].values``.
+        The arrays are converted on first access and cached.
+        Contiguous columns, e.g. numeric columns, are not copied
+        and share memory with ``self.train_df``.
+        The cache is rebuilt when ``self.train_df`` is replaced,
+        e.g. after adding features in ``self._check_input``,
+        so it is consistent with the final ``self.train_df``.
+
+        Parameters
+        ----------
+        col : `str`
+            The column name in ``self.train_df``.
+
+        Returns
+        -------
+        array : `numpy.ndarray`
+            The values of ``col``.
+        """
+        if self._train_arrays is None or self._train_arrays_df is not self.train_df:
+            self._train_arrays = {}
+            self._train_arrays_df = self.train_df
+        if col not in self._train_arrays:
+            self._train_arrays[col] = np.ascontiguousarray(self.train_df[col].to_numpy())
+        return self._train_arrays[col]
+
+    @abstractmethod
+    def _predict_array(
+            self,
+            pred: np.ndarray) -> np.ndarray:
+        """Predicts the interval bounds around the predicted values.
+
+        This is the array entry point used by ``self.predict``.
+        Subclasses override this method instead of ``self.predict``
+        to keep the per-row computation on contiguous arrays,
+        e.g. to compile it with ``numba``.
+
+        Parameters
+        ----------
+        pred : `numpy.ndarray`
+            The C-contiguous float64 array of predicted values with shape (n,).
+
+        Returns
+        -------
+        bounds : `numpy.ndarray`
+            The array of lower and upper bounds with shape (n, 2).
+        """
+        raise UncertaintyError(
+            f"{self.__class__.__name__} must override `_predict_array` or `predict`.")
 
     def predict(
             self,
             fut_df: pd.DataFrame):
         """Predicts the uncertainty columns for ``fut_df``.
 
+        The default implementation passes the predicted values to
+        ``self._predict_array`` and appends the returned bounds as
+        `~greykite.common.constants.PREDICTED_LOWER_COL` and
+        `~greykite.common.constants.PREDICTED_UPPER_COL`.
+        The predicted values are taken from `~greykite.common.constants.PREDICTED_COL`
+        if it exists, otherwise from ``self.value_col``.
+
         Parameters
         ----------
         fut_df : `pandas.DataFrame`
             The data used for prediction.
+
+        Returns
+        -------
+        result_df : `pandas.DataFrame`
+            The ``fut_df`` augmented with prediction intervals.
         """
-        pass
+        pred_col = cst.PREDICTED_COL if cst.PREDICTED_COL in fut_df.columns else self.value_col
+        if pred_col not in fut_df.columns:
+            raise UncertaintyError(
+                f"Neither {cst.PREDICTED_COL} nor the value column {self.value_col} is found in `fut_df`.")
+        pred = np.ascontiguousarray(fut_df[pred_col].to_numpy(), dtype=np.float64)
+        bounds = self._predict_array(pred)
+        if not isinstance(bounds, np.ndarray) or bounds.shape != (len(pred), 2):
+            raise UncertaintyError(
+                f"`_predict_array` must return an array with shape ({len(pred)}, 2), "
+                f"found {getattr(bounds, 'shape', type(bounds))}.")
+        bounds_df = pd.DataFrame(
+            bounds,
+            index=fut_df.index,
+            columns=[cst.PREDICTED_LOWER_COL, cst.PREDICTED_UPPER_COL])
+        self.pred_df = pd.concat([fut_df, bounds_df], axis=1)
+        return self.pred_df
@@ -67,6 +67,13 @@ class SimpleConditionalResidualsModel(BaseUncertaintyModel):
     # but it's preferred to provide this parameter to ensure correctness.
     REQUIRED_PARAMS = ["value_col"]
 
+    __slots__ = (
+        "coverage",
+        "time_col",
+        "residual_col",
+        "conditional_cols"
+    )
+
     def __init__(
             self,
             uncertainty_dict: Dict[str, any],
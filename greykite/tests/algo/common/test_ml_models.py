@@ -1,8 +1,11 @@
+import warnings
+
 import numpy as np
 import pandas as pd
 import pytest
 from pandas.util.testing import assert_frame_equal
 
+from greykite.algo.common.ml_models import _model_desc_from_formula
 from greykite.algo.common.ml_models import breakdown_regression_based_prediction
 from greykite.algo.common.ml_models import design_mat_from_formula
 from greykite.algo.common.ml_models import fit_ml_model
@@ -65,6 +68,19 @@ def test_design_mat_from_formula(design_mat_info):
     assert design_mat_info["y_col"] == "y"
 
 
+def test_design_mat_from_formula_cache():
+    """Tests the parsed formula is reused, but the design info follows the data"""
+    _model_desc_from_formula.cache_clear()
+    model_formula_str = "y~C(x)"
+    df1 = pd.DataFrame({"x": ["a", "b", "a"], "y": [1, 2, 3]})
+    df2 = pd.DataFrame({"x": ["a", "b", "c"], "y": [1, 2, 3]})
+    res1 = design_mat_from_formula(df1, model_formula_str)
+    res2 = design_mat_from_formula(df2, model_formula_str)
+    assert _model_desc_from_formula.cache_info().hits == 1
+    assert res1["pred_cols"] == ["Intercept", "C(x)[T.b]"]
+    assert res2["pred_cols"] == ["Intercept", "C(x)[T.b]", "C(x)[T.c]"]
+
+
 def test_fit_model_via_design_matrix(design_mat_info):
     """Tests fit_model_via_design_matrix"""
     x_train = design_mat_info["x_mat"]
@@ -316,6 +332,26 @@ def generate_test_data_for_fitting(
     }
 
 
+def test_fit_ml_model_predict_no_warning():
+    """Tests fitting with uncertainty and predicting raise no warnings
+    about feature names, since the models are fitted on arrays"""
+    data = generate_test_data_for_fitting()
+    for fit_algorithm in ["ridge", "rf", "linear"]:
+        with warnings.catch_warnings(record=True) as record:
+            warnings.simplefilter("always")
+            trained_model = fit_ml_model(
+                df=data["df"],
+                model_formula_str=data["model_formula_str"],
+                fit_algorithm=fit_algorithm,
+                uncertainty_dict={
+                    "uncertainty_method": "simple_conditional_residuals",
+                    "params": {}})
+            predict_ml(
+                fut_df=data["df_test"],
+                trained_model=trained_model)
+        assert not [w for w in record if "feature names" in str(w.message)]
+
+
 def test_fit_ml_model():
     """Tests ``fit_ml_model``"""
     data = generate_test_data_for_fitting()
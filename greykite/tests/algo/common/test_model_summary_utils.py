@@ -4,6 +4,10 @@ import pytest
 from sklearn.linear_model import RidgeCV
 
 from greykite.algo.common.model_summary_utils import Bootstrapper
+from greykite.algo.common.model_summary_utils import add_model_df_lm
+from greykite.algo.common.model_summary_utils import add_model_params_lm
+from greykite.algo.common.model_summary_utils import add_model_ss_lm
+from greykite.algo.common.model_summary_utils import create_info_dict_lm
 from greykite.algo.common.model_summary_utils import format_summary_df
 from greykite.algo.common.model_summary_utils import get_info_dict_lm
 from greykite.algo.common.model_summary_utils import print_summary
@@ -180,3 +184,28 @@ def test_degenerate_columns():
         pred_cols=pred_cols)
     assert info_dict["beta_var_cov"].shape == (3, 3)
     print_summary(info_dict)
+
+
+def test_identity_weights():
+    """Tests the non-weighted path matches explicit identity weights."""
+    x = np.concatenate([np.ones([100, 1]), np.random.randn(100, 3)], axis=1)
+    y = x @ np.array([1.0, 2.0, 3.0, 4.0]) + np.random.randn(100)
+    ml_model = RidgeCV().fit(x, y)
+    beta = ml_model.coef_
+    beta[0] += ml_model.intercept_
+    info_dicts = []
+    for weights in [None, np.eye(100)]:
+        info_dict = create_info_dict_lm(
+            x=x,
+            y=y,
+            beta=beta,
+            ml_model=ml_model,
+            fit_algorithm="ridge",
+            pred_cols=["Intercept", "x1", "x2", "x3"])
+        info_dict = add_model_params_lm(info_dict)
+        info_dict["weights"] = weights
+        info_dict = add_model_df_lm(info_dict)
+        info_dict = add_model_ss_lm(info_dict)
+        info_dicts.append(info_dict)
+    for key in ["reg_df", "df_sse", "sse", "ssr", "sst", "mse", "msr", "mst"]:
+        assert info_dicts[0][key] == pytest.approx(info_dicts[1][key])
@@ -584,7 +584,8 @@ def test_convert_simple_silverkite_params_hourly(hourly_data):
         # ``time_properties``, which is the default 24 for hourly data.
         forecast_horizon=24,
         simulation_based=False,
-        simulation_num=10
+        simulation_num=10,
+        time_features_df=None
     )
     assert_equal(parameters, expected)
 
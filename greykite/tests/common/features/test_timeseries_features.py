@@ -237,6 +237,55 @@ def test_add_time_features_df():
     assert df.shape[0] == train_df.shape[0]
 
 
+def test_add_time_features_df_with_cache():
+    """Tests add_time_features_df with precomputed ``time_features_df``"""
+    date_list = pd.date_range(
+        start=datetime.datetime(2019, 1, 1),
+        periods=100,
+        freq="MS").tolist()
+    df0 = pd.DataFrame({TIME_COL: date_list})
+    # The cache is built with a different origin,
+    # growth terms are recomputed from "conti_year".
+    time_features_df = build_time_features_df(
+        dt=df0[TIME_COL],
+        conti_year_origin=2010)
+
+    # Subset of the cached timestamps
+    df_subset = df0.iloc[10:50].copy()
+    expected = add_time_features_df(
+        df=df_subset,
+        time_col=TIME_COL,
+        conti_year_origin=2019)
+    result = add_time_features_df(
+        df=df_subset,
+        time_col=TIME_COL,
+        conti_year_origin=2019,
+        time_features_df=time_features_df)
+    assert_equal(result, expected)
+
+    # Cache indexed by "datetime"
+    result = add_time_features_df(
+        df=df_subset,
+        time_col=TIME_COL,
+        conti_year_origin=2019,
+        time_features_df=time_features_df.set_index("datetime", drop=False))
+    assert_equal(result, expected)
+
+    # Timestamps outside of the cache, falls back to building the features
+    df_new = pd.DataFrame({
+        TIME_COL: pd.date_range(start=datetime.datetime(2030, 1, 1), periods=5, freq="MS")})
+    expected = add_time_features_df(
+        df=df_new,
+        time_col=TIME_COL,
+        conti_year_origin=2019)
+    result = add_time_features_df(
+        df=df_new,
+        time_col=TIME_COL,
+        conti_year_origin=2019,
+        time_features_df=time_features_df)
+    assert_equal(result, expected)
+
+
 def test_get_holidays():
     """Tests get_holidays"""
     # request holidays by country code
@@ -12,6 +12,8 @@ from greykite.common.constants import METRIC_COL
 from greykite.common.constants import START_DATE_COL
 from greykite.common.constants import TIME_COL
 from greykite.common.constants import VALUE_COL
+from greykite.common.features.timeseries_features import build_time_features_df
+from greykite.common.features.timeseries_features import get_default_origin_for_time_vars
 from greykite.common.python_utils import assert_equal
 from greykite.common.testing_utils import generate_df_for_tests
 from greykite.common.testing_utils import generate_df_with_reg_for_tests
@@ -184,6 +186,33 @@ def test_load_data_anomaly():
     assert_equal(ts.df_before_adjustment, canonical_data_dict["df_before_adjustment"])
 
 
+def test_get_time_features_df():
+    """Checks time features computation and caching"""
+    ts = UnivariateTimeSeries()
+    with pytest.raises(RuntimeError, match="Must load data before computing time features."):
+        ts.get_time_features_df()
+
+    df = generate_df_for_tests(freq="MS", periods=36)["df"]
+    ts.load_data(df, TIME_COL, VALUE_COL)
+    assert ts.time_features_df is None
+    time_features_df = ts.get_time_features_df()
+    expected = build_time_features_df(
+        dt=df[TIME_COL],
+        conti_year_origin=get_default_origin_for_time_vars(df, TIME_COL))
+    assert_equal(
+        time_features_df.reset_index(drop=True),
+        expected.reset_index(drop=True))
+    # indexed by timestamp for lookups
+    assert list(time_features_df.index) == list(df[TIME_COL])
+    # cached
+    assert ts.get_time_features_df() is time_features_df
+
+    # cache is reset when data is reloaded
+    ts.load_data(df.iloc[:24], TIME_COL, VALUE_COL)
+    assert ts.time_features_df is None
+    assert ts.get_time_features_df().shape[0] == 24
+
+
 def test_make_future_dataframe():
     """Checks future dataframe creation"""
     ts = UnivariateTimeSeries()
@@ -11,6 +11,7 @@ from greykite.common.constants import TIME_COL
 from greykite.common.constants import VALUE_COL
 from greykite.common.data_loader import DataLoader
 from greykite.common.evaluation import EvaluationMetricEnum
+from greykite.common.features.timeseries_features import build_time_features_df
 from greykite.common.python_utils import assert_equal
 from greykite.common.testing_utils import generate_df_for_tests
 from greykite.common.testing_utils import generate_df_with_reg_for_tests
@@ -580,6 +581,64 @@ def test_run_forecast_json():
             greater_is_better=False)
 
 
+def test_run_forecast_config_with_time_features_df():
+    """Tests `run_forecast_config` with precomputed ``time_features_df``"""
+    data = generate_df_for_tests(freq="MS", periods=60)
+    df = data["df"]
+    config = ForecastConfig(
+        model_template=ModelTemplateEnum.SILVERKITE.name,
+        forecast_horizon=4,
+        coverage=0.95,
+        metadata_param=MetadataParam(freq="MS"),
+        evaluation_period_param=EvaluationPeriodParam(
+            test_horizon=4,
+            cv_horizon=4,
+            cv_min_train_periods=24,
+            cv_max_splits=2),
+        model_components_param=ModelComponentsParam(
+            seasonality={
+                "yearly_seasonality": False,
+                "quarterly_seasonality": False,
+                "monthly_seasonality": False,
+                "weekly_seasonality": False,
+                "daily_seasonality": False},
+            custom={
+                "fit_algorithm_dict": {"fit_algorithm": "ridge"},
+                "extra_pred_cols": ["ct_sqrt", "ct1", "C(month, levels=list(range(1, 13)))"]},
+            events={"holiday_lookup_countries": None}))
+    time_features_df = build_time_features_df(
+        dt=df[TIME_COL],
+        conti_year_origin=2000)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected = Forecaster().run_forecast_config(df=df, config=config)
+        forecaster = Forecaster()
+        result = forecaster.run_forecast_config(
+            df=df,
+            config=config,
+            time_features_df=time_features_df)
+
+    assert_equal(result.model[-1].time_features_df, time_features_df)
+    assert_equal(result.forecast.df, expected.forecast.df)
+    assert_equal(result.backtest.df, expected.backtest.df)
+    assert_equal(result.grid_search.cv_results_["mean_test_MAPE"], expected.grid_search.cv_results_["mean_test_MAPE"])
+
+    # Estimators without ``time_features_df`` ignore it.
+    forecaster = Forecaster()
+    forecaster.apply_forecast_config(
+        df=df,
+        config=ForecastConfig(
+            model_template=ModelTemplateEnum.AUTO_ARIMA.name,
+            metadata_param=MetadataParam(freq="MS")))
+    with LogCapture(LOGGER_NAME) as log_capture:
+        forecaster._Forecaster__apply_time_features_df_to_pipeline_parameters(time_features_df)
+        log_capture.check(
+            (LOGGER_NAME,
+             "WARNING",
+             "The estimator AutoArimaEstimator does not accept `time_features_df`, it is ignored."))
+
+
 def test_run_forecast_config_with_single_simple_silverkite_template():
     # The generic name of single simple silverkite templates are not added to `ModelTemplateEnum`,
     # therefore we test if these are recognized.
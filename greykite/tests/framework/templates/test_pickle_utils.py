@@ -3,8 +3,14 @@ import os
 import sys
 from collections import OrderedDict
 
+import numpy as np
+import pandas as pd
+import patsy
 import pytest
 
+from greykite.common.constants import PREDICTED_COL
+from greykite.common.constants import TIME_COL
+from greykite.common.constants import VALUE_COL
 from greykite.common.python_utils import assert_equal
 from greykite.common.testing_utils import generate_df_for_tests
 from greykite.framework.templates.autogen.forecast_config import ComputationParam
@@ -18,6 +24,7 @@ from greykite.framework.templates.pickle_utils import dump_obj
 from greykite.framework.templates.pickle_utils import load_obj
 from greykite.framework.templates.pickle_utils import recursive_rm_dir
 from greykite.framework.utils.result_summary import summarize_grid_search_results
+from greykite.sklearn.uncertainty.simple_conditional_residuals_model import SimpleConditionalResidualsModel
 
 
 try:
@@ -145,6 +152,36 @@ def test_class():
     recursive_rm_dir("class")
 
 
+def test_class_with_slots():
+    """Tests a class instance with ``__slots__`` that can not be dumped directly."""
+    df = pd.DataFrame({
+        TIME_COL: pd.date_range("2020-01-01", freq="D", periods=50),
+        VALUE_COL: np.arange(50.0),
+        PREDICTED_COL: np.arange(50.0) + np.random.randn(50)
+    })
+    model = SimpleConditionalResidualsModel(
+        uncertainty_dict={
+            "uncertainty_method": "simple_conditional_residuals",
+            "params": {"value_col": VALUE_COL, "residual_col": "residual_col"}},
+        coverage=0.95,
+        time_col=TIME_COL)
+    model.fit(train_df=df)
+    # ``DesignInfo`` can not be dumped directly,
+    # so the model is dumped recursively by its attributes.
+    model.uncertainty_model["design_info"] = patsy.dmatrix("x", pd.DataFrame({"x": [1, 2]})).design_info
+    dump_obj(model, "class_with_slots", overwrite_exist_dir=True)
+    loaded = load_obj("class_with_slots")
+    recursive_rm_dir("class_with_slots")
+    assert loaded.__class__ == model.__class__
+    for attr in ["uncertainty_dict", "coverage", "time_col", "value_col", "residual_col",
+                 "uncertainty_method", "params", "conditional_cols"]:
+        assert_equal(getattr(loaded, attr), getattr(model, attr))
+    assert_equal(loaded.train_df, model.train_df)
+    assert loaded.uncertainty_model.keys() == model.uncertainty_model.keys()
+    assert loaded.uncertainty_model["design_info"].column_names == ["Intercept", "x"]
+    assert_equal(loaded.predict(df), model.predict(df))
+
+
 def test_forecast_result_silverkite(df, result):
     dump_obj(
         result,
@@ -1,7 +1,10 @@
+import numpy as np
 import pandas as pd
 import pytest
 
+from greykite.common import constants as cst
 from greykite.sklearn.uncertainty.base_uncertainty_model import BaseUncertaintyModel
+from greykite.sklearn.uncertainty.exceptions import UncertaintyError
 from greykite.sklearn.uncertainty.uncertainty_methods import UncertaintyMethodEnum
 
 
@@ -23,11 +26,17 @@ def test_init(uncertainty_dict):
     assert model .uncertainty_dict == uncertainty_dict
     assert model.a == 1
     assert model.b == "2"
+    assert model.value_col is None
     assert model.uncertainty_method is None
     assert model.params is None
     assert model.train_df is None
+    assert model._train_arrays is None
+    assert model._train_arrays_df is None
     assert model.uncertainty_model is None
     assert model.pred_df is None
+    # Known attributes are stored in slots, extra kwargs in ``__dict__``.
+    assert model.__dict__ == {"a": 1, "b": "2"}
+    assert BaseUncertaintyModel(uncertainty_dict=uncertainty_dict).__dict__ == {}
 
 
 def test_check_input():
@@ -42,3 +51,88 @@ def test_fit():
     )
     model.fit(train_df=pd.DataFrame({}))
     assert model.train_df is not None
+
+    train_df = pd.DataFrame({
+        "a": [1.0, 2.0, 3.0],
+        "b": [4, 5, 6]
+    })
+    model.fit(train_df=train_df)
+    # New columns in the input do not change ``train_df``.
+    train_df["c"] = 0
+    assert list(model.train_df.columns) == ["a", "b"]
+
+
+def test_get_train_array():
+    model = BaseUncertaintyModel(
+        uncertainty_dict={}
+    )
+    model.fit(train_df=pd.DataFrame({
+        "a": [1.0, 2.0, 3.0],
+        "b": [4, 5, 6]
+    }))
+    # Nothing is converted until requested.
+    assert model._train_arrays is None
+    array = model._get_train_array("a")
+    assert array.flags["C_CONTIGUOUS"]
+    assert np.shares_memory(array, model.train_df["a"].to_numpy())
+    np.testing.assert_array_equal(array, [1.0, 2.0, 3.0])
+    assert list(model._train_arrays) == ["a"]
+    assert model._get_train_array("a") is array
+    # The cache is rebuilt when ``train_df`` is replaced.
+    model.train_df = model.train_df.assign(a=[7.0, 8.0, 9.0])
+    np.testing.assert_array_equal(model._get_train_array("a"), [7.0, 8.0, 9.0])
+
+
+def test_predict():
+    class ConstantWidthModel(BaseUncertaintyModel):
+        def _check_input(self):
+            pass
+
+        def _predict_array(self, pred):
+            return np.stack([pred - 1, pred + 1], axis=1)
+
+    fut_df = pd.DataFrame({
+        "x": [10.0, 20.0, 30.0],
+        cst.TIME_COL: pd.date_range("2020-01-01", periods=3),
+        cst.VALUE_COL: [1, 2, 3]
+    }, index=[5, 6, 7])
+    # Uses ``value_col`` when the prediction column is not given.
+    model = ConstantWidthModel(uncertainty_dict={}, value_col=cst.VALUE_COL)
+    result_df = model.predict(fut_df)
+    assert list(result_df.columns) == ["x", cst.TIME_COL, cst.VALUE_COL, cst.PREDICTED_LOWER_COL, cst.PREDICTED_UPPER_COL]
+    assert list(result_df.index) == [5, 6, 7]
+    assert list(result_df[cst.PREDICTED_LOWER_COL]) == [0, 1, 2]
+    assert list(result_df[cst.PREDICTED_UPPER_COL]) == [2, 3, 4]
+    assert model.pred_df is result_df
+
+    # Uses the prediction column when it is given.
+    fut_df[cst.PREDICTED_COL] = [101, 102, 103]
+    result_df = model.predict(fut_df)
+    assert list(result_df[cst.PREDICTED_LOWER_COL]) == [100, 101, 102]
+    assert list(result_df[cst.PREDICTED_UPPER_COL]) == [102, 103, 104]
+
+    # Raises when neither column is found.
+    model = ConstantWidthModel(uncertainty_dict={})
+    with pytest.raises(UncertaintyError, match="Neither"):
+        model.predict(fut_df.drop(columns=[cst.PREDICTED_COL]))
+
+    # Raises when ``_predict_array`` is not overridden.
+    class NoPredictModel(BaseUncertaintyModel):
+        def _check_input(self):
+            pass
+
+    model = NoPredictModel(uncertainty_dict={}, value_col=cst.VALUE_COL)
+    with pytest.raises(UncertaintyError, match="must override `_predict_array`"):
+        model.predict(fut_df)
+
+    # Raises when ``_predict_array`` returns the wrong shape.
+    class WrongShapeModel(BaseUncertaintyModel):
+        def _check_input(self):
+            pass
+
+        def _predict_array(self, pred):
+            return pred
+
+    model = WrongShapeModel(uncertainty_dict={}, value_col=cst.VALUE_COL)
+    with pytest.raises(UncertaintyError, match=r"shape \(3, 2\)"):
+        model.predict(fut_df)
@@ -219,3 +219,23 @@ def test_fit_and_predict(df, uncertainty_dict):
             UncertaintyError,
             match=f"The value column {VALUE_COL} is not found in `fut_df`."):
         model.predict(fut_df=df[[TIME_COL]])
+
+
+def test_get_train_array(df, uncertainty_dict):
+    """Tests the training arrays match ``train_df`` after ``_check_input`` adds columns."""
+    uncertainty_dict["params"]["conditional_cols"] = ["dow"]
+    uncertainty_dict["params"]["residual_col"] = "residual_col"
+    model = SimpleConditionalResidualsModel(
+        uncertainty_dict=uncertainty_dict,
+        coverage=0.99,
+        time_col=TIME_COL
+    )
+    input_cols = list(df.columns)
+    model.fit(train_df=df)
+    # The input is not modified.
+    assert list(df.columns) == input_cols
+    # The residual column and the time features are added by ``_check_input``.
+    residual = model._get_train_array("residual_col")
+    np.testing.assert_allclose(residual, df[VALUE_COL] - df[PREDICTED_COL])
+    assert np.shares_memory(residual, model.train_df["residual_col"].to_numpy())
+    np.testing.assert_array_equal(model._get_train_array("dow"), model.train_df["dow"].values)